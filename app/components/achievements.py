@@ -2,7 +2,6 @@
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
 import sqlite3
 import time
 
@@ -16,6 +15,39 @@ from app.utils.achievements import (
     get_achievement_by_id
 )
 
+# Card templates, filled per achievement with str.format_map
+_CARD_UNLOCKED_TMPL = (
+    '<div style="background-color: #E5F77D; border: 2px solid #59A14F; border-radius: 0; padding: 10px; margin-bottom: 10px; opacity: 1;">'
+    '<div style="font-size: 2rem; text-align: center;">{icon}</div>'
+    '<div style="font-weight: bold; color: #67597A; text-align: center;">{name}</div>'
+    '<div style="color: #67597A; font-size: 0.8rem; text-align: center;">{description}</div>'
+    '<div style="background-color: #59A14F; color: white; text-align: center; font-size: 0.7rem; padding: 2px; margin-top: 5px;">Unlocked on {date_unlocked_fmt}</div>'
+    '</div>'
+)
+
+_CARD_LOCKED_TMPL = (
+    '<div style="background-color: #F4F7BE; border: 2px solid #757761; border-radius: 0; padding: 10px; margin-bottom: 10px; opacity: 0.7;">'
+    '<div style="font-size: 2rem; text-align: center;">{icon}</div>'
+    '<div style="font-weight: bold; color: #757761; text-align: center;">{name}</div>'
+    '<div style="color: #757761; font-size: 0.8rem; text-align: center;">{description}</div>'
+    '</div>'
+)
+
+_NOTIFICATION_TMPL = """
+        <div class="achievement-notification" style="
+            background-color: #E5F77D;
+            border: 2px solid #59A14F;
+            padding: 15px;
+            margin: 10px 0;
+            text-align: center;
+        ">
+            <div style="font-size: 3rem;">{icon}</div>
+            <div style="font-weight: bold; color: #67597A; font-size: 1.2rem;">Achievement Unlocked!</div>
+            <div style="font-weight: bold; color: #67597A;">{name}</div>
+            <div style="color: #757761;">{description}</div>
+        </div>
+        """
+
 
 def display_achievements():
     """Display all achievements with their status."""
@@ -28,6 +60,10 @@ def display_achievements():
         st.info("No achievements defined yet.")
         return
 
+    # Format unlock dates once for the whole frame rather than per card
+    achievements_df['date_unlocked_fmt'] = pd.to_datetime(
+        achievements_df['date_unlocked'], format="%Y-%m-%d %H:%M:%S", errors='coerce').dt.strftime("%b %d, %Y")
+
     # Group by type
     achievement_types = {
         "STUDY_TIME": "Study Time Milestones",
@@ -35,52 +71,30 @@ def display_achievements():
         "SECTION": "Study Manual Sections"
     }
 
+    # Split the frame by type in a single pass
+    groups = {key: group for key, group in achievements_df.groupby('type', sort=False)}
+
     for achievement_type, type_name in achievement_types.items():
-        type_achievements = achievements_df[achievements_df['type'] == achievement_type]
+        type_achievements = groups.get(achievement_type)
 
-        if not type_achievements.empty:
+        if type_achievements is not None and not type_achievements.empty:
             st.markdown(f"<h4 style='color: #67597A;'>{type_name}</h4>", unsafe_allow_html=True)
 
-            # Create a grid layout for achievements
-            cols_per_row = 3
-            for i in range(0, len(type_achievements), cols_per_row):
-                cols = st.columns(cols_per_row)
-
-                for j in range(cols_per_row):
-                    if i + j < len(type_achievements):
-                        achievement = type_achievements.iloc[i + j]
-                        with cols[j]:
-                            display_achievement_card(achievement)
+            # Render the whole grid as one CSS grid block instead of a widget per card
+            cards_html = ''.join(
+                display_achievement_card(achievement)
+                for achievement in type_achievements.itertuples(index=False, name='Achievement')
+            )
+            st.markdown(
+                f'<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px;">{cards_html}</div>',
+                unsafe_allow_html=True)
 
 
 def display_achievement_card(achievement):
-    """Display a single achievement card."""
-    # Determine card style based on unlock status
-    if achievement['unlocked']:
-        bg_color = "#E5F77D"  # Bright lime - unlocked
-        border_color = "#59A14F"  # Secondary color
-        text_color = "#67597A"  # Deep purple
-        opacity = "1"
-    else:
-        bg_color = "#F4F7BE"  # Light cream - locked
-        border_color = "#757761"  # Olive gray
-        text_color = "#757761"  # Olive gray
-        opacity = "0.7"
-
-    # Create card HTML with properly formatted strings
-    card_html = f'<div style="background-color: {bg_color}; border: 2px solid {border_color}; border-radius: 0; padding: 10px; margin-bottom: 10px; opacity: {opacity};">'
-    card_html += f'<div style="font-size: 2rem; text-align: center;">{achievement["icon"]}</div>'
-    card_html += f'<div style="font-weight: bold; color: {text_color}; text-align: center;">{achievement["name"]}</div>'
-    card_html += f'<div style="color: {text_color}; font-size: 0.8rem; text-align: center;">{achievement["description"]}</div>'
-
-    # Add unlocked date if achievement is unlocked
-    if achievement['unlocked']:
-        unlocked_date = datetime.strptime(achievement['date_unlocked'], "%Y-%m-%d %H:%M:%S").strftime("%b %d, %Y")
-        card_html += f'<div style="background-color: {border_color}; color: white; text-align: center; font-size: 0.7rem; padding: 2px; margin-top: 5px;">Unlocked on {unlocked_date}</div>'
-
-    card_html += '</div>'
-
-    st.markdown(card_html, unsafe_allow_html=True)
+    """Build the HTML for a single achievement card."""
+    # Pick the card style based on unlock status
+    template = _CARD_UNLOCKED_TMPL if achievement.unlocked else _CARD_LOCKED_TMPL
+    return template.format_map(achievement._asdict())
 
 
 def display_achievement_notification(achievement_id):
@@ -88,25 +102,7 @@ def display_achievement_notification(achievement_id):
     achievement = get_achievement_by_id(achievement_id)
 
     if achievement:
-        notification_html = f"""
-        <div style="
-            background-color: #E5F77D;
-            border: 2px solid #59A14F;
-            padding: 15px;
-            margin: 10px 0;
-            text-align: center;
-        ">
-            <div style="font-size: 3rem;">{achievement['icon']}</div>
-            <div style="font-weight: bold; color: #67597A; font-size: 1.2rem;">Achievement Unlocked!</div>
-            <div style="font-weight: bold; color: #67597A;">{achievement['name']}</div>
-            <div style="color: #757761;">{achievement['description']}</div>
-        </div>
-        """
-
-        st.markdown(notification_html, unsafe_allow_html=True)
-
-        # Add a small celebration effect - could be replaced with a more elaborate animation
-        st.balloons()
+        st.markdown(_NOTIFICATION_TMPL.format_map(achievement), unsafe_allow_html=True)
 
 
 def check_and_display_new_achievements():
@@ -118,6 +114,10 @@ def check_and_display_new_achievements():
     for achievement_id in newly_unlocked:
         display_achievement_notification(achievement_id)
 
+    # Celebrate once per batch rather than once per achievement
+    if newly_unlocked:
+        st.balloons()
+
     return newly_unlocked
 
 
@@ -132,55 +132,56 @@ def display_study_sections():
         st.info("No study sections defined yet.")
         return
 
+    # Format completion dates once for the whole frame rather than per section
+    sections_df['date_completed_fmt'] = pd.to_datetime(
+        sections_df['date_completed'], format="%Y-%m-%d %H:%M:%S", errors='coerce').dt.strftime("%b %d, %Y")
+
     # Calculate overall progress
-    completed_sections = sections_df['completed'].sum()
+    completed_sections = int(sections_df['completed'].to_numpy().sum())
     total_sections = len(sections_df)
     progress_percentage = (completed_sections / total_sections) * 100 if total_sections > 0 else 0
 
-    # Display progress bar
-    st.progress(progress_percentage / 100)
+    # Display progress bar and label as a single element
     st.markdown(
-        f"<div style='text-align: center; color: #67597A;'><b>Overall Progress:</b> {completed_sections}/{total_sections} sections completed ({progress_percentage:.1f}%)</div>",
+        f"<div style='text-align: center; color: #67597A;'><progress value='{completed_sections}' max='{total_sections}' style='width: 80%;'></progress><br><b>Overall Progress:</b> {completed_sections}/{total_sections} sections completed ({progress_percentage:.1f}%)</div>",
         unsafe_allow_html=True)
 
     # Display each section
-    for _, section in sections_df.iterrows():
-        with st.expander(f"{section['name']} {'✅' if section['completed'] else ''}"):
-            st.markdown(f"<div style='color: #67597A;'><b>Description:</b> {section['description']}</div>",
+    for section in sections_df.itertuples(index=False, name='Section'):
+        with st.expander(f"{section.name} {'✅' if section.completed else ''}"):
+            st.markdown(f"<div style='color: #67597A;'><b>Description:</b> {section.description}</div>",
                         unsafe_allow_html=True)
 
             # Display completion date if completed
-            if section['completed']:
-                completion_date = datetime.strptime(section['date_completed'], "%Y-%m-%d %H:%M:%S").strftime(
-                    "%b %d, %Y")
-                st.markdown(f"<div style='color: #59A14F;'><b>Completed on:</b> {completion_date}</div>",
+            if section.completed:
+                st.markdown(f"<div style='color: #59A14F;'><b>Completed on:</b> {section.date_completed_fmt}</div>",
                             unsafe_allow_html=True)
 
                 # Option to mark as incomplete
-                if st.button("Mark as Incomplete", key=f"incomplete_{section['id']}"):
+                if st.button("Mark as Incomplete", key=f"incomplete_{section.id}"):
                     try:
-                        mark_section_incomplete(section['id'])
-                        st.success(f"'{section['name']}' marked as incomplete.")
-                        st.experimental_rerun()
+                        mark_section_incomplete(section.id)
+                        st.success(f"'{section.name}' marked as incomplete.")
+                        st.rerun()
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
             else:
                 # Option to mark as completed
-                if st.button("Mark as Completed", key=f"complete_{section['id']}"):
+                if st.button("Mark as Completed", key=f"complete_{section.id}"):
                     try:
                         # Use a key in session state to prevent multiple clicks
-                        if f"processing_{section['id']}" not in st.session_state:
-                            st.session_state[f"processing_{section['id']}"] = True
-                            success = mark_section_completed(section['id'])
+                        if f"processing_{section.id}" not in st.session_state:
+                            st.session_state[f"processing_{section.id}"] = True
+                            success = mark_section_completed(section.id)
                             if success:
-                                st.success(f"'{section['name']}' marked as completed!")
+                                st.success(f"'{section.name}' marked as completed!")
                             else:
                                 st.error("Failed to mark as completed. Please try again.")
                             # Clear the processing flag after a short delay
                             import time
                             time.sleep(0.1)
-                            st.session_state.pop(f"processing_{section['id']}", None)
-                            st.experimental_rerun()
+                            st.session_state.pop(f"processing_{section.id}", None)
+                            st.rerun()
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
-                        st.session_state.pop(f"processing_{section['id']}", None)
\ No newline at end of file
+                        st.session_state.pop(f"processing_{section.id}", None)
\ No newline at end of file
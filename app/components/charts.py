@@ -1,8 +1,8 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import streamlit as st
 from datetime import datetime, timedelta
-from app.utils.helpers import calculate_daily_target, get_config
+from app.utils.helpers import daily_counts_and_cumsum
 
 
 # New color palette
@@ -13,33 +13,98 @@ COLOR_SUCCESS = "#E5F77D"     # Bright lime
 COLOR_BACKGROUND = "#F4F7BE"  # Light cream
 COLOR_TEXT = "#E5F77D"        # Lime for text
 
+# Custom color sequence for the different application statuses using our palette
+STATUS_COLORS = {
+    'Applied': COLOR_PRIMARY,
+    'No Response': COLOR_SECONDARY,
+    'Rejected': COLOR_ACCENT,
+    'Screening Call': COLOR_SUCCESS,
+    'Interview': "#8F9973",  # Darker olive
+    'Second Interview': "#938BA1",  # Lighter purple
+    'Final Interview': "#79695C",  # Brown shade
+    'Offer': "#F6D300",  # Gold
+    'Accepted': "#AEDB39",  # Lime green
+    'Declined': "#FF9770"   # Light coral
+}
+ORDERED_STATUSES = tuple(STATUS_COLORS)
+
+# Layout shared by every chart, layered over Plotly's dark theme
+CHART_TEMPLATE = 'plotly_dark+job_tracker'
+
+
+def _register_chart_template():
+    """Register the shared 'job_tracker' Plotly template on first use."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    if 'job_tracker' in pio.templates:
+        return
+
+    pio.templates['job_tracker'] = go.layout.Template(layout=go.Layout(
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color=COLOR_TEXT)
+        ),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0.05)',
+        font=dict(
+            family="Courier New, monospace",
+            color=COLOR_TEXT
+        ),
+        xaxis=dict(
+            gridcolor=COLOR_PRIMARY,
+            zerolinecolor=COLOR_PRIMARY
+        ),
+        yaxis=dict(
+            gridcolor=COLOR_PRIMARY,
+            zerolinecolor=COLOR_PRIMARY
+        )
+    ))
+
 
+def _empty_fig(title, **layout):
+    """Return a blank, styled figure for charts with no data to plot."""
+    import plotly.graph_objects as go
+    _register_chart_template()
+
+    return go.Figure().update_layout(title=title, template='plotly+job_tracker', **layout)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
 def plot_applications_over_time(jobs_df):
     """
     Create a chart showing job applications over time.
 
     Args:
-        jobs_df: DataFrame containing job application data
+        jobs_df: DataFrame containing job application data (date_applied as datetime64)
 
     Returns:
         plotly.graph_objects.Figure: Applications over time chart
     """
-    jobs_df['date_applied'] = pd.to_datetime(jobs_df['date_applied'])
-    jobs_by_date = jobs_df.groupby(jobs_df['date_applied'].dt.date).size().reset_index(name='count')
-    jobs_by_date.columns = ['Date', 'Applications']
-
-    # Calculate cumulative applications
-    jobs_by_date['Cumulative'] = jobs_by_date['Applications'].cumsum()
-
-    # Create a date range for all dates in the range
-    if len(jobs_by_date) > 1:
-        date_range = pd.date_range(start=jobs_by_date['Date'].min(), end=jobs_by_date['Date'].max())
-        complete_date_df = pd.DataFrame({'Date': date_range})
-        complete_date_df['Date'] = complete_date_df['Date'].dt.date
-        jobs_by_date = pd.merge(complete_date_df, jobs_by_date, on='Date', how='left').fillna(0)
-
-        # Recalculate cumulative after filling missing dates
-        jobs_by_date['Cumulative'] = jobs_by_date['Applications'].cumsum()
+    # Applications without a date_applied are left out of the trend
+    days = jobs_df['date_applied'].dropna()
+    if days.empty:
+        return _empty_fig('Application Trends Over Time', xaxis_title='Date', yaxis_title='Applications')
+
+    import plotly.graph_objects as go
+    _register_chart_template()
+
+    # Bin applications by day offset from the first application; this fills the
+    # gaps in the date range and yields the running total without a groupby
+    days = days.dt.normalize()
+    start_day = days.min()
+    day_offsets = (days - start_day).dt.days.to_numpy()
+    daily_counts, cumulative = daily_counts_and_cumsum(day_offsets, day_offsets.max() + 1)
+
+    jobs_by_date = pd.DataFrame({
+        'Date': pd.date_range(start=start_day, periods=len(daily_counts)),
+        'Applications': daily_counts,
+        'Cumulative': cumulative
+    })
 
     # Create the chart with new color scheme
     fig = go.Figure()
@@ -61,34 +126,13 @@ def plot_applications_over_time(jobs_df):
         title='Application Trends Over Time',
         xaxis_title='Date',
         yaxis_title='Applications',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=COLOR_TEXT)
-        ),
-        template='plotly_dark',
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.05)',
-        font=dict(
-            family="Courier New, monospace",
-            color=COLOR_TEXT
-        ),
-        xaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
-        yaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        )
+        template=CHART_TEMPLATE
     )
 
     return fig
 
 
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
 def plot_status_distribution(jobs_df):
     """
     Create a pie chart showing distribution of job application statuses.
@@ -99,41 +143,30 @@ def plot_status_distribution(jobs_df):
     Returns:
         plotly.graph_objects.Figure: Status distribution pie chart
     """
-    status_counts = jobs_df['status'].value_counts().reset_index()
-    status_counts.columns = ['Status', 'Count']
-
-    # Define a custom color sequence for different statuses using our palette
-    color_map = {
-        'Applied': COLOR_PRIMARY,
-        'No Response': COLOR_SECONDARY,
-        'Rejected': COLOR_ACCENT,
-        'Screening Call': COLOR_SUCCESS,
-        'Interview': "#8F9973",  # Darker olive
-        'Second Interview': "#938BA1",  # Lighter purple
-        'Final Interview': "#79695C",  # Brown shade
-        'Offer': "#F6D300",  # Gold
-        'Accepted': "#AEDB39",  # Lime green
-        'Declined': "#FF9770"   # Light coral
-    }
-
-    # Get colors for the statuses in our data
-    colors = [color_map.get(status, COLOR_ACCENT) for status in status_counts['Status']]
-
-    fig = px.pie(
-        status_counts,
-        values='Count',
-        names='Status',
-        title='Application Status Distribution',
-        color_discrete_sequence=colors
-    )
-
-    fig.update_traces(
+    if jobs_df.empty:
+        return _empty_fig('Application Status Distribution')
+
+    import plotly.graph_objects as go
+    _register_chart_template()
+
+    # Count over a categorical in palette order so labels, counts and colors
+    # line up positionally; custom statuses are appended with the accent color
+    extra_statuses = [s for s in jobs_df['status'].dropna().unique() if s not in STATUS_COLORS]
+    categories = np.array(ORDERED_STATUSES + tuple(extra_statuses), dtype=object)
+    palette = np.array(list(STATUS_COLORS.values()) + [COLOR_ACCENT] * len(extra_statuses), dtype=object)
+    counts = pd.Series(pd.Categorical(jobs_df['status'], categories=categories)).value_counts(sort=False).to_numpy()
+    present = counts > 0
+
+    fig = go.Figure(go.Pie(
+        labels=categories[present],
+        values=counts[present],
+        marker=dict(colors=palette[present], line=dict(color='rgba(0,0,0,0.2)', width=2)),
         textposition='inside',
-        textinfo='percent+label',
-        marker=dict(line=dict(color='rgba(0,0,0,0.2)', width=2))
-    )
+        textinfo='percent+label'
+    ))
 
     fig.update_layout(
+        title='Application Status Distribution',
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -143,56 +176,47 @@ def plot_status_distribution(jobs_df):
             font=dict(color=COLOR_TEXT)
         ),
         margin=dict(t=60, b=60, l=20, r=20),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.05)',
-        font=dict(
-            family="Courier New, monospace",
-            color=COLOR_TEXT
-        )
+        template='plotly+job_tracker'
     )
 
     return fig
 
 
-def plot_study_progress(study_df, daily_target=None):
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def plot_study_progress(study_df, daily_target, end_date=None):
     """
     Create a chart showing study progress over time.
 
     Args:
-        study_df: DataFrame containing study log data
-        daily_target: Daily study target in minutes (default: dynamically calculated)
+        study_df: DataFrame containing study log data (date as datetime64)
+        daily_target: Daily study target in minutes, e.g. from get_daily_target(). It is
+            passed in rather than read from the config so it is part of the cache key.
+        end_date: Last day shown on the chart (default: today). Pass it explicitly
+            so the cached figure is invalidated when the day changes.
 
     Returns:
         plotly.graph_objects.Figure: Study progress chart
     """
-    # If daily_target is None, calculate it dynamically
-    if daily_target is None:
-        config = get_config()
-        manual_override = config.get('study_tracking', {}).get('daily_target_minutes', 0)
-        if manual_override > 0:
-            daily_target = manual_override
-        else:
-            total_target_hours = config.get('study_tracking', {}).get('total_target_hours', 300)
-            daily_target = calculate_daily_target(total_target_hours)
-
-    study_df['date'] = pd.to_datetime(study_df['date'])
-    study_by_date = study_df.groupby(study_df['date'].dt.date)['duration'].sum().reset_index()
-    study_by_date.columns = ['Date', 'Minutes']
+    if study_df.empty:
+        return _empty_fig('Daily Study Progress', xaxis_title='Date', yaxis_title='Minutes')
+
+    import plotly.graph_objects as go
+    _register_chart_template()
+
+    daily_minutes = study_df.groupby(study_df['date'].dt.normalize())['duration'].sum()
 
     # Get the date range for the last 30 days
-    end_date = datetime.now().date()
+    if end_date is None:
+        end_date = datetime.now().date()
     start_date = end_date - timedelta(days=29)
 
-    # Create a date range with all dates
+    # Align to the full date range, filling days without study with zero
     date_range = pd.date_range(start=start_date, end=end_date)
-    complete_study_df = pd.DataFrame({'Date': date_range})
-    complete_study_df['Date'] = complete_study_df['Date'].dt.date
-
-    # Merge with actual data and fill missing values
-    study_by_date = pd.merge(complete_study_df, study_by_date, on='Date', how='left').fillna(0)
+    study_by_date = daily_minutes.reindex(date_range, fill_value=0).rename_axis('Date').reset_index(name='Minutes')
 
     # Mark which days met the target
-    study_by_date['Target Met'] = study_by_date['Minutes'] >= daily_target
+    minutes = study_by_date['Minutes'].to_numpy(dtype=np.float64)
+    target_met = minutes >= daily_target
 
     # Create the chart with new color scheme
     fig = go.Figure()
@@ -200,7 +224,7 @@ def plot_study_progress(study_df, daily_target=None):
     # Add target line
     fig.add_trace(go.Scatter(
         x=study_by_date['Date'],
-        y=[daily_target] * len(study_by_date),
+        y=np.full(len(study_by_date), daily_target),
         mode='lines',
         name=f'Target ({daily_target} min)',
         line=dict(color=COLOR_ACCENT, width=2, dash='dash')
@@ -211,11 +235,15 @@ def plot_study_progress(study_df, daily_target=None):
         x=study_by_date['Date'],
         y=study_by_date['Minutes'],
         name='Study Minutes',
-        marker_color=study_by_date['Target Met'].map({True: COLOR_SUCCESS, False: COLOR_PRIMARY})
+        marker_color=np.where(target_met, COLOR_SUCCESS, COLOR_PRIMARY)
     ))
 
-    # Calculate 7-day moving average
-    study_by_date['7-Day Avg'] = study_by_date['Minutes'].rolling(window=7, min_periods=1).mean()
+    # Calculate 7-day moving average from a running sum: each window total is the
+    # difference of two prefix sums, averaged over the days available so far
+    prefix_sums = np.concatenate(([0.0], np.cumsum(minutes)))
+    window_ends = np.arange(1, len(minutes) + 1)
+    window_starts = np.maximum(window_ends - 7, 0)
+    study_by_date['7-Day Avg'] = (prefix_sums[window_ends] - prefix_sums[window_starts]) / (window_ends - window_starts)
 
     # Add moving average line
     fig.add_trace(go.Scatter(
@@ -230,92 +258,54 @@ def plot_study_progress(study_df, daily_target=None):
         title='Daily Study Progress',
         xaxis_title='Date',
         yaxis_title='Minutes',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=COLOR_TEXT)
-        ),
-        template='plotly_dark',
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.05)',
-        font=dict(
-            family="Courier New, monospace",
-            color=COLOR_TEXT
-        ),
-        xaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
-        yaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
+        template=CHART_TEMPLATE,
         hovermode='x unified'
     )
 
     return fig
 
 
-# Also update this function
-def plot_weekly_study_progress(study_df, daily_target=None):
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def plot_weekly_study_progress(study_df, daily_target):
     """
     Create a chart showing weekly study progress.
 
     Args:
-        study_df: DataFrame containing study log data
-        daily_target: Daily study target in minutes (default: dynamically calculated)
+        study_df: DataFrame containing study log data (date as datetime64)
+        daily_target: Daily study target in minutes, e.g. from get_daily_target()
 
     Returns:
         plotly.graph_objects.Figure: Weekly study progress chart
     """
-    # If daily_target is None, calculate it dynamically
-    if daily_target is None:
-        config = get_config()
-        manual_override = config.get('study_tracking', {}).get('daily_target_minutes', 0)
-        if manual_override > 0:
-            daily_target = manual_override
-        else:
-            total_target_hours = config.get('study_tracking', {}).get('total_target_hours', 300)
-            daily_target = calculate_daily_target(total_target_hours)
-
+    # Sessions without a date are left out of the weekly totals
+    study_df = study_df[study_df['date'].notna()]
     if study_df.empty:
-        # Return empty figure if no data
-        fig = go.Figure()
-        fig.update_layout(
-            title='Weekly Study Progress',
-            xaxis_title='Week',
-            yaxis_title='Minutes',
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0.05)',
-            font=dict(
-                family="Courier New, monospace",
-                color=COLOR_TEXT
-            )
-        )
-        return fig
-
-    # Create a copy to avoid modifying the original
-    weekly_study = study_df.copy()
-
-    # Extract week and year
-    weekly_study['date'] = pd.to_datetime(weekly_study['date'])
-    weekly_study['week'] = weekly_study['date'].dt.isocalendar().week
-    weekly_study['year'] = weekly_study['date'].dt.isocalendar().year
-
-    # Group by week and calculate total duration
-    weekly_study = weekly_study.groupby(['year', 'week'])['duration'].sum().reset_index()
+        return _empty_fig('Weekly Study Progress', xaxis_title='Week', yaxis_title='Minutes')
+
+    import plotly.graph_objects as go
+    _register_chart_template()
+
+    # Bin total duration by ISO week (Monday to Sunday) on integer week offsets,
+    # keeping only weeks that have at least one logged session
+    days = study_df['date'].dt.normalize()
+    week_starts = days - pd.to_timedelta(days.dt.dayofweek, unit='D')
+    first_week = week_starts.min()
+    week_offsets = ((week_starts - first_week).dt.days // 7).to_numpy()
+    weekly_minutes = np.bincount(week_offsets, weights=study_df['duration'].to_numpy(dtype=np.float64))
+    logged_weeks = np.flatnonzero(np.bincount(week_offsets))
+    weekly_study = pd.DataFrame({
+        'week_start': first_week + pd.to_timedelta(logged_weeks * 7, unit='D'),
+        'duration': weekly_minutes[logged_weeks]
+    })
 
     # Create week labels
-    weekly_study['week_label'] = weekly_study['year'].astype(str) + '-W' + weekly_study['week'].astype(str)
+    weekly_study['week_label'] = weekly_study['week_start'].dt.strftime('%G-W%V')
 
     # Calculate weekly target
     weekly_target = daily_target * 7
 
     # Determine if target was met
-    weekly_study['target_met'] = weekly_study['duration'] >= weekly_target
+    target_met = weekly_study['duration'].to_numpy() >= weekly_target
 
     # Create the chart with new color scheme
     fig = go.Figure()
@@ -324,14 +314,14 @@ def plot_weekly_study_progress(study_df, daily_target=None):
     fig.add_trace(go.Bar(
         x=weekly_study['week_label'],
         y=weekly_study['duration'],
-        marker_color=weekly_study['target_met'].map({True: COLOR_SUCCESS, False: COLOR_PRIMARY}),
+        marker_color=np.where(target_met, COLOR_SUCCESS, COLOR_PRIMARY),
         name='Study Minutes'
     ))
 
     # Add weekly target line
     fig.add_trace(go.Scatter(
         x=weekly_study['week_label'],
-        y=[weekly_target] * len(weekly_study),
+        y=np.full(len(weekly_study), weekly_target),
         mode='lines',
         name=f'Weekly Target ({weekly_target} min)',
         line=dict(color=COLOR_ACCENT, dash='dash')
@@ -341,130 +331,8 @@ def plot_weekly_study_progress(study_df, daily_target=None):
         title='Weekly Study Progress',
         xaxis_title='Week',
         yaxis_title='Minutes',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=COLOR_TEXT)
-        ),
-        template='plotly_dark',
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.05)',
-        font=dict(
-            family="Courier New, monospace",
-            color=COLOR_TEXT
-        ),
-        xaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
-        yaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
+        template=CHART_TEMPLATE,
         hovermode='x unified'
     )
 
     return fig
-
-
-def plot_weekly_study_progress(study_df, daily_target=70):
-    """
-    Create a chart showing weekly study progress.
-
-    Args:
-        study_df: DataFrame containing study log data
-        daily_target: Daily study target in minutes (default: 70)
-
-    Returns:
-        plotly.graph_objects.Figure: Weekly study progress chart
-    """
-    if study_df.empty:
-        # Return empty figure if no data
-        fig = go.Figure()
-        fig.update_layout(
-            title='Weekly Study Progress',
-            xaxis_title='Week',
-            yaxis_title='Minutes',
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0.05)',
-            font=dict(
-                family="Courier New, monospace",
-                color=COLOR_TEXT
-            )
-        )
-        return fig
-
-    # Create a copy to avoid modifying the original
-    weekly_study = study_df.copy()
-
-    # Extract week and year
-    weekly_study['date'] = pd.to_datetime(weekly_study['date'])
-    weekly_study['week'] = weekly_study['date'].dt.isocalendar().week
-    weekly_study['year'] = weekly_study['date'].dt.isocalendar().year
-
-    # Group by week and calculate total duration
-    weekly_study = weekly_study.groupby(['year', 'week'])['duration'].sum().reset_index()
-
-    # Create week labels
-    weekly_study['week_label'] = weekly_study['year'].astype(str) + '-W' + weekly_study['week'].astype(str)
-
-    # Calculate weekly target
-    weekly_target = daily_target * 7
-
-    # Determine if target was met
-    weekly_study['target_met'] = weekly_study['duration'] >= weekly_target
-
-    # Create the chart with new color scheme
-    fig = go.Figure()
-
-    # Add bars for weekly study time
-    fig.add_trace(go.Bar(
-        x=weekly_study['week_label'],
-        y=weekly_study['duration'],
-        marker_color=weekly_study['target_met'].map({True: COLOR_SUCCESS, False: COLOR_PRIMARY}),
-        name='Study Minutes'
-    ))
-
-    # Add weekly target line
-    fig.add_trace(go.Scatter(
-        x=weekly_study['week_label'],
-        y=[weekly_target] * len(weekly_study),
-        mode='lines',
-        name=f'Weekly Target ({weekly_target} min)',
-        line=dict(color=COLOR_ACCENT, dash='dash')
-    ))
-
-    fig.update_layout(
-        title='Weekly Study Progress',
-        xaxis_title='Week',
-        yaxis_title='Minutes',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=COLOR_TEXT)
-        ),
-        template='plotly_dark',
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.05)',
-        font=dict(
-            family="Courier New, monospace",
-            color=COLOR_TEXT
-        ),
-        xaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
-        yaxis=dict(
-            gridcolor=COLOR_PRIMARY,
-            zerolinecolor=COLOR_PRIMARY
-        ),
-        hovermode='x unified'
-    )
-
-    return fig
\ No newline at end of file
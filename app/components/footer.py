@@ -1,26 +1,27 @@
 import streamlit as st
 
 
-def display_footer():
-    """
-    Display a clean, professional footer with the app version and credits.
-    """
-    # Use custom HTML/CSS to create a professionally styled footer
-    footer_html = """
+# Use custom HTML/CSS to create a professionally styled footer
+_FOOTER_HTML = """
+<div style="
+    margin-top: 3rem;
+    padding: 1rem;
+    border: 2px solid #E5F77D;
+    text-align: center;
+">
     <div style="
-        margin-top: 3rem;
-        padding: 1rem;
-        border: 2px solid #E5F77D;
-        text-align: center;
+        font-family: 'Courier New', monospace;
+        color: #757761;
+        font-size: 0.8rem;
     ">
-        <div style="
-            font-family: 'Courier New', monospace;
-            color: #757761;
-            font-size: 0.8rem;
-        ">
-            Job Hunt & Study Tracker v1.0.1 • Built with ❤️ and Streamlit
-        </div>
+        Job Hunt & Study Tracker v1.0.1 • Built with ❤️ and Streamlit
     </div>
-    """
+</div>
+"""
 
-    st.markdown(footer_html, unsafe_allow_html=True)
\ No newline at end of file
+
+def display_footer():
+    """
+    Display a clean, professional footer with the app version and credits.
+    """
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
@@ -1,43 +1,10 @@
 import streamlit as st
 import datetime
-import json
 import os
-from pathlib import Path
 
 from app.utils.database import add_job, log_study_time
 from app.utils.file_handler import save_resume, save_cover_letter
-
-
-# Load configuration
-def get_config():
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "job_tracking": {
-                "statuses": [
-                    "Applied",
-                    "No Response",
-                    "Rejected",
-                    "Screening Call",
-                    "Interview",
-                    "Second Interview",
-                    "Final Interview",
-                    "Offer",
-                    "Accepted",
-                    "Declined"
-                ]
-            },
-            "study_tracking": {
-                "daily_target_minutes": 70
-            }
-        }
-
-
-config = get_config()
+from app.utils.helpers import calculate_daily_target, get_config
 
 
 def job_application_form():
@@ -56,6 +23,7 @@ def job_application_form():
         date_applied = st.date_input("Date Applied", datetime.datetime.now())
 
         # Status selection
+        config = get_config()
         status_options = config.get('job_tracking', {}).get('statuses', [
             "Applied", "No Response", "Rejected", "Screening Call",
             "Interview", "Second Interview", "Final Interview",
@@ -112,9 +80,6 @@ def study_log_form():
     Returns:
         bool: True if study time was logged, False otherwise
     """
-    # Import the dynamic calculation function
-    from app.utils.helpers import calculate_daily_target, get_config
-
     with st.form("study_log_form"):
         st.subheader("Log Your Study Time")
 
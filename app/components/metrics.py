@@ -1,9 +1,43 @@
 import random
+import numpy as np
 import streamlit as st
 from datetime import datetime, timedelta
 import pandas as pd
 
 
+# Statuses counted towards the interview rate
+INTERVIEW_STATUSES = frozenset({'Interview', 'Second Interview', 'Final Interview'})
+
+# Affirmation pools for display_affirmation
+_AFFIRMATIONS = (
+    "You're making excellent progress! Keep up the great work!",
+    "Every application brings you closer to your goal. Stay persistent!",
+    "Your dedication to studying will pay off. Keep going!",
+    "You're developing great habits for success. Well done!",
+    "Focus on progress, not perfection. You're doing great!",
+    "Your consistent efforts will lead to great results!",
+    "Small steps every day lead to big achievements!",
+    "You're taking control of your career journey. Impressive!",
+    "Your determination is inspiring. Keep pushing forward!"
+)
+
+_JOB_SPECIFIC = (
+    "Your job search strategy is working! Keep refining your approach.",
+    "Each application is a learning opportunity. You're growing with each one!",
+    "The right opportunity is coming your way. Stay persistent!",
+    "Your hard work in the job search will pay off soon."
+)
+
+_STUDY_SPECIFIC = (
+    "Your consistent study habits are building a strong foundation for success.",
+    "Every minute of study is an investment in your future.",
+    "Your dedication to learning will set you apart in your career.",
+    "Small, consistent study sessions add up to significant progress over time."
+)
+
+_RNG = random.Random()
+
+
 def display_metrics(jobs_df, study_df):
     """
     Calculate and display key metrics for the dashboard.
@@ -17,16 +51,14 @@ def display_metrics(jobs_df, study_df):
     """
     # Calculate job metrics
     total_applications = len(jobs_df) if not jobs_df.empty else 0
-    interview_count = len(jobs_df[jobs_df['status'].isin(
-        ['Interview', 'Second Interview', 'Final Interview'])]) if not jobs_df.empty else 0
+    interview_count = int(jobs_df['status'].isin(INTERVIEW_STATUSES).sum()) if not jobs_df.empty else 0
 
-    # Calculate study progress for the last 7 days
+    # Calculate study progress for the last 7 days, comparing datetime64 values
+    # against a midnight cutoff rather than boxing each row to a Python date
     today = datetime.now().date()
-    last_week = today - timedelta(days=7)
+    last_week = pd.Timestamp(today - timedelta(days=7))
 
-    recent_study = study_df[
-        pd.to_datetime(study_df['date']).dt.date >= last_week] if not study_df.empty else pd.DataFrame()
-    total_minutes = recent_study['duration'].sum() if not recent_study.empty else 0
+    total_minutes = study_df.loc[study_df['date'] >= last_week, 'duration'].sum() if not study_df.empty else 0
 
     daily_target = 70  # 1h10m in minutes
     weekly_target = daily_target * 7
@@ -34,24 +66,15 @@ def display_metrics(jobs_df, study_df):
 
     # Weekly application goal (assuming 5 applications per week)
     weekly_goal = 5
-    recent_applications = len(
-        jobs_df[pd.to_datetime(jobs_df['date_applied']).dt.date >= last_week]) if not jobs_df.empty else 0
+    recent_applications = int((jobs_df['date_applied'] >= last_week).sum()) if not jobs_df.empty else 0
     application_progress = min(recent_applications / weekly_goal, 1) if weekly_goal > 0 else 0
 
     # Display metrics in columns
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Total Applications", total_applications)
-
-    with col2:
-        st.metric("Interview Rate", f"{interview_count}/{total_applications}" if total_applications > 0 else "0/0")
-
-    with col3:
-        st.metric("Weekly Study Progress", f"{int(study_progress * 100)}%")
-
-    with col4:
-        st.metric("Weekly Application Goal", f"{recent_applications}/{weekly_goal}")
+    cols = st.columns(4)
+    cols[0].metric("Total Applications", total_applications)
+    cols[1].metric("Interview Rate", f"{interview_count}/{total_applications}" if total_applications > 0 else "0/0")
+    cols[2].metric("Weekly Study Progress", f"{int(study_progress * 100)}%")
+    cols[3].metric("Weekly Application Goal", f"{recent_applications}/{weekly_goal}")
 
     return application_progress, study_progress
 
@@ -67,46 +90,19 @@ def display_affirmation(job_progress, study_progress):
     Returns:
         str: A motivational affirmation
     """
-    affirmations = [
-        "You're making excellent progress! Keep up the great work!",
-        "Every application brings you closer to your goal. Stay persistent!",
-        "Your dedication to studying will pay off. Keep going!",
-        "You're developing great habits for success. Well done!",
-        "Focus on progress, not perfection. You're doing great!",
-        "Your consistent efforts will lead to great results!",
-        "Small steps every day lead to big achievements!",
-        "You're taking control of your career journey. Impressive!",
-        "Your determination is inspiring. Keep pushing forward!"
-    ]
-
-    # Add more specific affirmations based on progress
-    job_specific = [
-        "Your job search strategy is working! Keep refining your approach.",
-        "Each application is a learning opportunity. You're growing with each one!",
-        "The right opportunity is coming your way. Stay persistent!",
-        "Your hard work in the job search will pay off soon."
-    ]
-
-    study_specific = [
-        "Your consistent study habits are building a strong foundation for success.",
-        "Every minute of study is an investment in your future.",
-        "Your dedication to learning will set you apart in your career.",
-        "Small, consistent study sessions add up to significant progress over time."
-    ]
-
     # Select the appropriate affirmation based on progress
     if job_progress > 0.8 and study_progress > 0.8:
-        return random.choice(affirmations) + " You're excelling in both job hunting and studying!"
+        return _RNG.choice(_AFFIRMATIONS) + " You're excelling in both job hunting and studying!"
     elif job_progress > 0.8:
-        return random.choice(job_specific) + " Your job search is going strong!"
+        return _RNG.choice(_JOB_SPECIFIC) + " Your job search is going strong!"
     elif study_progress > 0.8:
-        return random.choice(study_specific) + " Your study habits are excellent!"
+        return _RNG.choice(_STUDY_SPECIFIC) + " Your study habits are excellent!"
     elif job_progress > 0.5 and study_progress > 0.5:
-        return random.choice(affirmations) + " You're making solid progress on all fronts."
+        return _RNG.choice(_AFFIRMATIONS) + " You're making solid progress on all fronts."
     elif job_progress < 0.3 and study_progress < 0.3:
         return "Remember, progress takes time. Stay consistent and keep pushing forward!"
     else:
-        return random.choice(affirmations)
+        return _RNG.choice(_AFFIRMATIONS)
 
 
 def calculate_streak(study_df):
@@ -122,31 +118,23 @@ def calculate_streak(study_df):
     if study_df.empty:
         return 0
 
-    # Convert date column to datetime if it's not already
-    study_df['date'] = pd.to_datetime(study_df['date'])
-
-    # Get all unique dates with study sessions
-    dates = sorted(study_df['date'].dt.date.unique())
+    # Get all unique study days as sorted datetime64 day numbers
+    dates = study_df['date'].dropna().to_numpy().astype('datetime64[D]')
+    dates = np.unique(dates)
 
-    if not dates:
+    if len(dates) == 0:
         return 0
 
-    current_date = datetime.now().date()
-    yesterday = current_date - timedelta(days=1)
+    yesterday = np.datetime64(datetime.now().date() - timedelta(days=1), 'D')
 
     # If the most recent study date is more than a day old, streak is broken
     if dates[-1] < yesterday:
         return 0
 
-    # Count consecutive days backward from the most recent date
-    streak = 1  # Start with 1 for the most recent day
-    for i in range(len(dates) - 1, 0, -1):
-        if (dates[i] - dates[i - 1]).days == 1:
-            streak += 1
-        else:
-            break
-
-    return streak
+    # The streak is the trailing run of one-day gaps, plus the most recent day
+    gaps_from_end = np.diff(dates).astype(np.int64)[::-1]
+    breaks = np.flatnonzero(gaps_from_end != 1)
+    return int(breaks[0] if len(breaks) else len(gaps_from_end)) + 1
 
 
 def get_progress_color(progress):
@@ -1,124 +1,112 @@
 # app/components/section_manager.py
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 
-from app.utils.database import get_db_connection
+from app.utils.database import transaction
+from app.utils.achievements import clear_achievement_caches, get_study_sections
 
+# Insert statements shared by add_study_section and reset_to_custom_sections;
+# one statement text per table means each pooled connection prepares it once
+INSERT_SECTION_SQL = (
+    "INSERT INTO study_sections (id, name, description, order_num, completed) VALUES (?, ?, ?, ?, 0) "
+    "ON CONFLICT(id) DO NOTHING"
+)
+INSERT_ACHIEVEMENT_SQL = (
+    "INSERT INTO achievements (id, type, name, description, threshold, icon) VALUES (?, ?, ?, ?, ?, ?)"
+)
 
-def get_study_sections():
-    """Get all study sections with completion status."""
-    conn = get_db_connection()
 
-    sections_df = pd.read_sql('''
-    SELECT id, name, description, completed, date_completed, order_num
-    FROM study_sections
-    ORDER BY order_num
-    ''', conn)
-
-    conn.close()
-    return sections_df
+class DuplicateSectionError(Exception):
+    """Raised inside a transaction so adding an already existing section is rolled back."""
 
 
 def add_study_section(name, description, order_num):
     """Add a new study section."""
-    conn = get_db_connection()
-    c = conn.cursor()
-
     # Generate an ID based on the name
     section_id = f"section_{name.lower().replace(' ', '_')}"
 
     try:
-        # Insert the new section
-        c.execute(
-            "INSERT INTO study_sections (id, name, description, order_num, completed) VALUES (?, ?, ?, ?, 0)",
-            (section_id, name, description, order_num)
-        )
-
-        # Create an achievement for the section
-        section_achievement_id = f"complete_{section_id}"
-        c.execute(
-            "INSERT INTO achievements (id, type, name, description, threshold, icon) VALUES (?, ?, ?, ?, ?, ?)",
-            (section_achievement_id, "SECTION", f"Mastered: {name}",
-             f"Complete the {name} section of the study manual", 1, "📚")
-        )
-
-        conn.commit()
-
-        return True, "Section added successfully!"
+        with transaction() as c:
+            # Insert the new section, leaving an existing section with the same ID untouched
+            c.execute(
+                INSERT_SECTION_SQL,
+                (section_id, name, description, order_num)
+            )
+            if c.rowcount == 0:
+                raise DuplicateSectionError(name)
+
+            # Create an achievement for the section
+            section_achievement_id = f"complete_{section_id}"
+            c.execute(
+                INSERT_ACHIEVEMENT_SQL,
+                (section_achievement_id, "SECTION", f"Mastered: {name}",
+                 f"Complete the {name} section of the study manual", 1, "📚")
+            )
+    except DuplicateSectionError:
+        return False, f"A section named '{name}' already exists."
     except Exception as e:
-        conn.rollback()
         return False, f"Error adding section: {str(e)}"
-    finally:
-        conn.close()
+
+    clear_achievement_caches()
+    return True, "Section added successfully!"
 
 
 def update_study_section(section_id, name, description, order_num):
     """Update an existing study section."""
-    conn = get_db_connection()
-    c = conn.cursor()
-
     try:
-        # Update the section
-        c.execute(
-            "UPDATE study_sections SET name = ?, description = ?, order_num = ? WHERE id = ?",
-            (name, description, order_num, section_id)
-        )
-
-        # Update the achievement name and description
-        section_achievement_id = f"complete_{section_id}"
-        c.execute(
-            "UPDATE achievements SET name = ?, description = ? WHERE id = ?",
-            (f"Mastered: {name}", f"Complete the {name} section of the study manual", section_achievement_id)
-        )
-
-        conn.commit()
-
-        return True, "Section updated successfully!"
+        with transaction() as c:
+            # Update the section
+            c.execute(
+                "UPDATE study_sections SET name = ?, description = ?, order_num = ? WHERE id = ?",
+                (name, description, order_num, section_id)
+            )
+
+            # Update the achievement name and description
+            section_achievement_id = f"complete_{section_id}"
+            c.execute(
+                "UPDATE achievements SET name = ?, description = ? WHERE id = ?",
+                (f"Mastered: {name}", f"Complete the {name} section of the study manual", section_achievement_id)
+            )
     except Exception as e:
-        conn.rollback()
         return False, f"Error updating section: {str(e)}"
-    finally:
-        conn.close()
+
+    clear_achievement_caches()
+    return True, "Section updated successfully!"
 
 
 def delete_study_section(section_id):
     """Delete a study section."""
-    conn = get_db_connection()
-    c = conn.cursor()
-
     try:
-        # Delete section achievement first
-        section_achievement_id = f"complete_{section_id}"
-        c.execute("DELETE FROM user_achievements WHERE achievement_id = ?", (section_achievement_id,))
-        c.execute("DELETE FROM achievements WHERE id = ?", (section_achievement_id,))
-
-        # Then delete the section
-        c.execute("DELETE FROM study_sections WHERE id = ?", (section_id,))
-
-        conn.commit()
-
-        return True, "Section deleted successfully!"
+        with transaction() as c:
+            # Delete section achievement first
+            section_achievement_id = f"complete_{section_id}"
+            c.execute("DELETE FROM user_achievements WHERE achievement_id = ?", (section_achievement_id,))
+            c.execute("DELETE FROM achievements WHERE id = ?", (section_achievement_id,))
+
+            # Then delete the section
+            c.execute("DELETE FROM study_sections WHERE id = ?", (section_id,))
     except Exception as e:
-        conn.rollback()
         return False, f"Error deleting section: {str(e)}"
-    finally:
-        conn.close()
+
+    clear_achievement_caches()
+    return True, "Section deleted successfully!"
 
 
 def display_section_manager():
     """Display the study section manager interface."""
     st.markdown("<h3 style='color: #67597A;'>Manage Study Manual Sections</h3>", unsafe_allow_html=True)
 
-    # Get existing sections
+    # Get existing sections from the shared cached query; the forms below work on dicts
     sections_df = get_study_sections()
+    sections = sections_df.to_dict('records')
+    sections_by_id = {section['id']: section for section in sections}
 
     # Create tabs for different management functions
     tab1, tab2, tab3 = st.tabs(["View Sections", "Add Section", "Edit/Delete Sections"])
 
     with tab1:
-        if not sections_df.empty:
+        if sections:
             st.dataframe(
                 sections_df[['name', 'description', 'completed', 'order_num']].rename(
                     columns={
@@ -128,7 +116,7 @@ def display_section_manager():
                         'order_num': 'Order'
                     }
                 ),
-                use_container_width=True
+                width="stretch"
             )
         else:
             st.info("No study sections defined yet. Use the 'Add Section' tab to get started.")
@@ -140,7 +128,7 @@ def display_section_manager():
             name = st.text_input("Section Name")
             description = st.text_area("Description")
             order_num = st.number_input("Order", min_value=1,
-                                        value=len(sections_df) + 1 if not sections_df.empty else 1)
+                                        value=len(sections) + 1)
 
             submitted = st.form_submit_button("Add Section")
 
@@ -157,17 +145,17 @@ def display_section_manager():
     with tab3:
         st.markdown("<h4 style='color: #67597A;'>Edit or Delete Sections</h4>", unsafe_allow_html=True)
 
-        if sections_df.empty:
+        if not sections:
             st.info("No sections to edit. Add some sections first.")
         else:
             section_id = st.selectbox(
                 "Select Section to Edit/Delete",
-                options=sections_df['id'].tolist(),
-                format_func=lambda x: sections_df.loc[sections_df['id'] == x, 'name'].values[0]
+                options=list(sections_by_id),
+                format_func=lambda x: sections_by_id[x]['name']
             )
 
             if section_id:
-                selected_section = sections_df[sections_df['id'] == section_id].iloc[0]
+                selected_section = sections_by_id[section_id]
 
                 with st.form("edit_section_form"):
                     name = st.text_input("Section Name", value=selected_section['name'])
@@ -207,9 +195,6 @@ def display_section_manager():
 # Function to reset all sections to a predefined list
 def reset_to_custom_sections():
     """Reset study sections to a custom list."""
-    conn = get_db_connection()
-    c = conn.cursor()
-
     # Custom study sections
     custom_sections = [
         {"id": "section_1", "name": "General Probability", "description": "Basic probability concepts and rules",
@@ -223,37 +208,39 @@ def reset_to_custom_sections():
         {"id": "section_5", "name": "Review Section", "description": "Summary of all sections", "order": 5},
     ]
 
+    section_rows = [
+        (section['id'], section['name'], section['description'], section['order'])
+        for section in custom_sections
+    ]
+    achievement_rows = [
+        (f"complete_{section['id']}", "SECTION", f"Mastered: {section['name']}",
+         f"Complete the {section['name']} section of the study manual", 1, "📚")
+        for section in custom_sections
+    ]
+
     try:
-        # Delete existing section achievements
-        c.execute("DELETE FROM achievements WHERE type = 'SECTION'")
-        # Delete existing section completion records
-        c.execute("DELETE FROM user_achievements WHERE achievement_id LIKE 'complete_section_%'")
-        # Delete all study sections
-        c.execute("DELETE FROM study_sections")
-
-        # Insert the custom sections
-        for section in custom_sections:
-            c.execute(
-                "INSERT INTO study_sections (id, name, description, order_num, completed) VALUES (?, ?, ?, ?, 0)",
-                (section['id'], section['name'], section['description'], section['order'])
+        with transaction() as c:
+            # Delete existing section achievements
+            c.execute("DELETE FROM achievements WHERE type = 'SECTION'")
+            # Delete existing section completion records
+            c.execute("DELETE FROM user_achievements WHERE achievement_id LIKE 'complete_section_%'")
+            # Delete all study sections
+            c.execute("DELETE FROM study_sections")
+
+            # Insert the custom sections and an achievement for each one
+            c.executemany(
+                INSERT_SECTION_SQL,
+                section_rows
             )
-
-            # Create an achievement for each section
-            section_achievement_id = f"complete_{section['id']}"
-            c.execute(
-                "INSERT INTO achievements (id, type, name, description, threshold, icon) VALUES (?, ?, ?, ?, ?, ?)",
-                (section_achievement_id, "SECTION", f"Mastered: {section['name']}",
-                 f"Complete the {section['name']} section of the study manual", 1, "📚")
+            c.executemany(
+                INSERT_ACHIEVEMENT_SQL,
+                achievement_rows
             )
-
-        conn.commit()
-        return True, "Study sections have been reset to your custom list!"
-
     except Exception as e:
-        conn.rollback()
         return False, f"Error resetting study sections: {str(e)}"
-    finally:
-        conn.close()
+
+    clear_achievement_caches()
+    return True, "Study sections have been reset to your custom list!"
 
 
 def display_reset_button():
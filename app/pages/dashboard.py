@@ -1,12 +1,69 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
 from app.utils.database import get_all_jobs, get_study_logs
 from app.components.metrics import display_metrics, display_affirmation
 from app.components.charts import plot_applications_over_time, plot_status_distribution, plot_study_progress
+from app.utils.helpers import get_daily_target
+
+# Placeholder shown in place of a chart when there is no data for it
+CHART_EMPTY_HTML = """<div style="
+    background-color: #F4F7BE;
+    border: 2px solid #E5F77D;
+    padding: 15px;
+    text-align: center;
+    color: #67597A;
+    font-family: 'Courier New', monospace;
+">
+    {message}
+</div>"""
+
+# HTML for the Recent Activities panels, filled in with str.format for each row.
+# The header and empty-state blocks start at column 0 with no blank lines so that
+# joined with the rows they still parse as one HTML block.
+RECENT_PANEL_HEADER = """<div style="
+    background-color: #67597A;
+    padding: 10px;
+    text-align: center;
+    color: #F4F7BE;
+    font-family: 'Courier New', monospace;
+    font-weight: bold;
+    border: 2px solid #E5F77D;
+    border-bottom: none;
+">
+    {title}
+</div>"""
+
+RECENT_PANEL_EMPTY = """<div style="
+    border: 2px solid #E5F77D;
+    border-top: none;
+    padding: 20px;
+    text-align: center;
+    color: #757761;
+    height: 300px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-family: 'Courier New', monospace;
+">
+    {message}
+</div>"""
+
+RECENT_PANEL_OPEN = '<div style="border: 2px solid #E5F77D; border-top: none; padding: 10px; height: 300px; overflow-y: auto;">'
+
+RECENT_JOB_HTML = """
+                <div style="margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #E5F77D;">
+                    <div style="font-weight: bold; color: #67597A;">{company} - {position} ({status})</div>
+                    <div style="color: #757761;">Applied on: {date}</div>
+                """
+
+RECENT_STUDY_HTML = """
+                <div style="margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #E5F77D;">
+                    <div style="font-weight: bold; color: #67597A;">{date}</div>
+                    <div style="color: #757761;">Studied for {hours}h {minutes}m</div>
+                """
+
+RECENT_NOTES_HTML = '<div style="color: #757761; font-style: italic; margin-top: 5px;">Notes: {notes}</div>'
 
 
 def show():
@@ -18,14 +75,8 @@ def show():
     # Get job application and study data
     jobs_df = get_all_jobs()
     study_df = get_study_logs()
-
-    # Convert date columns to datetime
-    if not jobs_df.empty:
-        jobs_df['date_applied'] = pd.to_datetime(jobs_df['date_applied'])
-        jobs_df['last_updated'] = pd.to_datetime(jobs_df['last_updated'])
-
-    if not study_df.empty:
-        study_df['date'] = pd.to_datetime(study_df['date'])
+    has_jobs = not jobs_df.empty
+    has_study = not study_df.empty
 
     # Use the metrics component to display key metrics
     application_progress, study_progress = display_metrics(jobs_df, study_df)
@@ -53,7 +104,7 @@ def show():
         "<h3 style='color: #E5F77D; border-bottom: 2px solid #E5F77D; padding-bottom: 5px;'>Application Trends</h3>",
         unsafe_allow_html=True)
 
-    if not jobs_df.empty:
+    if has_jobs:
         # Create the chart directly without the container div
         fig = plot_applications_over_time(jobs_df)
         # Update chart layout for dark/transparent background
@@ -62,32 +113,11 @@ def show():
             plot_bgcolor='rgba(0,0,0,0.05)',
             font=dict(color="#E5F77D")
         )
-        # Draw a border around the chart using CSS
-        st.markdown("""
-        <style>
-        [data-testid="stPlotlyChart"] {
-            border: 2px solid #E5F77D;
-            padding: 10px;
-            margin-bottom: 20px;
-            background-color: rgba(0, 0, 0, 0.05);
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        st.plotly_chart(fig, use_container_width=True)
+        # The chart border comes from the stPlotlyChart rule in static/theme.css
+        st.plotly_chart(fig, width="stretch")
     else:
         st.markdown(
-            """
-            <div style="
-                background-color: #F4F7BE;
-                border: 2px solid #E5F77D;
-                padding: 15px;
-                text-align: center;
-                color: #67597A;
-                font-family: 'Courier New', monospace;
-            ">
-                📋 No application data available yet. Start adding job applications to see trends.
-            </div>
-            """,
+            CHART_EMPTY_HTML.format(message="📋 No application data available yet. Start adding job applications to see trends."),
             unsafe_allow_html=True
         )
 
@@ -96,7 +126,7 @@ def show():
         "<h3 style='color: #E5F77D; border-bottom: 2px solid #E5F77D; padding-bottom: 5px;'>Application Status Distribution</h3>",
         unsafe_allow_html=True)
 
-    if not jobs_df.empty and len(jobs_df['status'].unique()) > 1:
+    if has_jobs and jobs_df['status'].nunique() > 1:
         # Create the chart directly without the container div
         fig = plot_status_distribution(jobs_df)
         # Update chart layout for dark/transparent background
@@ -105,21 +135,10 @@ def show():
             plot_bgcolor='rgba(0,0,0,0.05)',
             font=dict(color="#E5F77D")
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, width="stretch")
     else:
         st.markdown(
-            """
-            <div style="
-                background-color: #F4F7BE;
-                border: 2px solid #E5F77D;
-                padding: 15px;
-                text-align: center;
-                color: #67597A;
-                font-family: 'Courier New', monospace;
-            ">
-                📊 Not enough application data with different statuses available yet.
-            </div>
-            """,
+            CHART_EMPTY_HTML.format(message="📊 Not enough application data with different statuses available yet."),
             unsafe_allow_html=True
         )
 
@@ -128,30 +147,19 @@ def show():
         "<h3 style='color: #E5F77D; border-bottom: 2px solid #E5F77D; padding-bottom: 5px;'>Study Progress</h3>",
         unsafe_allow_html=True)
 
-    if not study_df.empty:
+    if has_study:
         # Create the chart directly without the container div
-        fig = plot_study_progress(study_df)
+        fig = plot_study_progress(study_df, get_daily_target(), end_date=datetime.now().date())
         # Update chart layout for dark/transparent background
         fig.update_layout(
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0.05)',
             font=dict(color="#E5F77D")
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, width="stretch")
     else:
         st.markdown(
-            """
-            <div style="
-                background-color: #F4F7BE;
-                border: 2px solid #E5F77D;
-                padding: 15px;
-                text-align: center;
-                color: #67597A;
-                font-family: 'Courier New', monospace;
-            ">
-                📚 No study data available yet. Start logging your study time to see progress.
-            </div>
-            """,
+            CHART_EMPTY_HTML.format(message="📚 No study data available yet. Start logging your study time to see progress."),
             unsafe_allow_html=True
         )
 
@@ -163,144 +171,70 @@ def show():
     col1, col2 = st.columns(2)
 
     with col1:
-        # Recent Applications Header
-        st.markdown(
-            """
-            <div style="
-                background-color: #67597A;
-                padding: 10px;
-                text-align: center;
-                color: #F4F7BE;
-                font-family: 'Courier New', monospace;
-                font-weight: bold;
-                border: 2px solid #E5F77D;
-                border-bottom: none;
-            ">
-                Recent Applications
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        # Recent Applications header and content, sent as a single markdown block
+        recent_container = [RECENT_PANEL_HEADER.format(title="Recent Applications")]
 
-        # Recent Applications Content
-        if not jobs_df.empty:
+        if has_jobs:
             # Make sure we have unique job entries by company and position
-            jobs_df['company_position'] = jobs_df['company'] + ' - ' + jobs_df['position']
-            recent_jobs = jobs_df.drop_duplicates(subset=['company_position']).sort_values('date_applied',
-                                                                                           ascending=False).head(5)
+            recent_jobs = jobs_df.drop_duplicates(subset=['company', 'position']).nlargest(5, 'date_applied')
 
-            # Create a container div for the content
-            recent_container = '<div style="border: 2px solid #E5F77D; border-top: none; padding: 10px; height: 300px; overflow-y: auto;">'
+            # Format notes with ellipsis if too long
+            notes = recent_jobs['notes'].fillna('')
+            recent_jobs = recent_jobs.assign(notes=notes.mask(notes.str.len() > 100, notes.str.slice(0, 97) + '...'))
 
-            for _, job in recent_jobs.iterrows():
-                job_date = job['date_applied'].strftime('%Y-%m-%d')
+            # Collect the HTML pieces in a list and join them once
+            recent_container.append(RECENT_PANEL_OPEN)
 
-                # Format notes with ellipsis if too long
-                notes = job['notes'] if job['notes'] else ""
-                if len(notes) > 100:
-                    notes = notes[:97] + "..."
+            job_rows = recent_jobs[['company', 'position', 'status', 'date_applied', 'notes']].itertuples(
+                index=False, name=None)
 
-                recent_container += f"""
-                <div style="margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #E5F77D;">
-                    <div style="font-weight: bold; color: #67597A;">{job['company']} - {job['position']} ({job['status']})</div>
-                    <div style="color: #757761;">Applied on: {job_date}</div>
-                """
+            for company, position, status, date_applied, notes in job_rows:
+                recent_container.append(RECENT_JOB_HTML.format(
+                    company=company, position=position, status=status, date=date_applied.strftime('%Y-%m-%d')))
 
                 if notes:
-                    recent_container += f'<div style="color: #757761; font-style: italic; margin-top: 5px;">Notes: {notes}</div>'
+                    recent_container.append(RECENT_NOTES_HTML.format(notes=notes))
 
-                recent_container += '</div>'
+                recent_container.append('</div>')
 
-            recent_container += '</div>'
-            st.markdown(recent_container, unsafe_allow_html=True)
+            recent_container.append('</div>')
         else:
             # Empty state for no applications
-            st.markdown(
-                """
-                <div style="
-                    border: 2px solid #E5F77D;
-                    border-top: none;
-                    padding: 20px;
-                    text-align: center;
-                    color: #757761;
-                    height: 300px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    font-family: 'Courier New', monospace;
-                ">
-                    No recent job applications.
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+            recent_container.append(RECENT_PANEL_EMPTY.format(message="No recent job applications."))
+
+        st.markdown("".join(recent_container), unsafe_allow_html=True)
 
     with col2:
-        # Recent Study Sessions Header
-        st.markdown(
-            """
-            <div style="
-                background-color: #67597A;
-                padding: 10px;
-                text-align: center;
-                color: #F4F7BE;
-                font-family: 'Courier New', monospace;
-                font-weight: bold;
-                border: 2px solid #E5F77D;
-                border-bottom: none;
-            ">
-                Recent Study Sessions
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        # Recent Study Sessions header and content, sent as a single markdown block
+        study_container = [RECENT_PANEL_HEADER.format(title="Recent Study Sessions")]
 
-        # Recent Study Sessions Content
-        if not study_df.empty:
+        if has_study:
             recent_study = study_df.sort_values('date', ascending=False).head(5)
 
-            # Create a container div for the content
-            study_container = '<div style="border: 2px solid #E5F77D; border-top: none; padding: 10px; height: 300px; overflow-y: auto;">'
+            # Split durations into hours and minutes for all rows at once
+            recent_study = recent_study.assign(
+                hours=recent_study['duration'] // 60,
+                minutes=recent_study['duration'] % 60,
+                notes=recent_study['notes'].fillna('')
+            )
 
-            for _, session in recent_study.iterrows():
-                session_date = session['date'].strftime('%Y-%m-%d')
-                hours = session['duration'] // 60
-                minutes = session['duration'] % 60
+            # Collect the HTML pieces in a list and join them once
+            study_container.append(RECENT_PANEL_OPEN)
 
-                # Format notes
-                notes = session['notes'] if session['notes'] else ""
+            study_rows = recent_study[['date', 'hours', 'minutes', 'notes']].itertuples(index=False, name=None)
 
-                study_container += f"""
-                <div style="margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #E5F77D;">
-                    <div style="font-weight: bold; color: #67597A;">{session_date}</div>
-                    <div style="color: #757761;">Studied for {hours}h {minutes}m</div>
-                """
+            for session_date, hours, minutes, notes in study_rows:
+                study_container.append(RECENT_STUDY_HTML.format(
+                    date=session_date.strftime('%Y-%m-%d'), hours=hours, minutes=minutes))
 
                 if notes:
-                    study_container += f'<div style="color: #757761; font-style: italic; margin-top: 5px;">Notes: {notes}</div>'
+                    study_container.append(RECENT_NOTES_HTML.format(notes=notes))
 
-                study_container += '</div>'
+                study_container.append('</div>')
 
-            study_container += '</div>'
-            st.markdown(study_container, unsafe_allow_html=True)
+            study_container.append('</div>')
         else:
             # Empty state for no study sessions
-            st.markdown(
-                """
-                <div style="
-                    border: 2px solid #E5F77D;
-                    border-top: none;
-                    padding: 20px;
-                    text-align: center;
-                    color: #757761;
-                    height: 300px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    font-family: 'Courier New', monospace;
-                ">
-                    No recent study sessions.
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
\ No newline at end of file
+            study_container.append(RECENT_PANEL_EMPTY.format(message="No recent study sessions."))
+
+        st.markdown("".join(study_container), unsafe_allow_html=True)
@@ -1,47 +1,29 @@
+import html
 import streamlit as st
 import pandas as pd
-import json
 from datetime import datetime
 import os
-from pathlib import Path
+from functools import lru_cache
 
 from app.utils.database import get_all_jobs, update_job, get_job, delete_job
 from app.utils.file_handler import get_file_download_link, save_resume, save_cover_letter, delete_file
+from app.utils.helpers import DEFAULT_CONFIG, get_config
 from app.components.forms import job_application_form
 
 
-# Load configuration
-def get_config():
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "job_tracking": {
-                "statuses": [
-                    "Applied",
-                    "No Response",
-                    "Rejected",
-                    "Screening Call",
-                    "Interview",
-                    "Second Interview",
-                    "Final Interview",
-                    "Offer",
-                    "Accepted",
-                    "Declined"
-                ]
-            }
-        }
-
-
-config = get_config()
-status_options = config.get('job_tracking', {}).get('statuses', [
-    "Applied", "No Response", "Rejected", "Screening Call",
-    "Interview", "Second Interview", "Final Interview",
-    "Offer", "Accepted", "Declined"
-])
+def get_status_options():
+    """Get the configured job statuses from the cached app configuration."""
+    return get_config().get('job_tracking', {}).get('statuses', DEFAULT_CONFIG['job_tracking']['statuses'])
+
+
+@lru_cache(maxsize=1)
+def _status_index(statuses):
+    return {status: i for i, status in enumerate(statuses)}
+
+
+def get_status_index():
+    """Map each configured status to its position, rebuilt whenever the status list changes."""
+    return _status_index(tuple(get_status_options()))
 
 
 def show():
@@ -71,6 +53,8 @@ def show():
     with tab2:
         st.markdown("<h3 style='color: #67597A;'>View and Update Job Applications</h3>", unsafe_allow_html=True)
 
+        status_options = get_status_options()
+
         # Get job data from database
         jobs_df = get_all_jobs()
 
@@ -88,23 +72,25 @@ def show():
             with col2:
                 search_term = st.text_input("Search by Company or Position", "")
 
-            # Apply filters
-            filtered_df = jobs_df.copy()
+            # Apply filters as one boolean mask, selecting rows only once
+            mask = pd.Series(True, index=jobs_df.index)
 
             if status_filter:
-                filtered_df = filtered_df[filtered_df['status'].isin(status_filter)]
+                mask &= jobs_df['status'].isin(status_filter)
 
             if search_term:
-                search_mask = (
-                        filtered_df['company'].str.contains(search_term, case=False) |
-                        filtered_df['position'].str.contains(search_term, case=False)
-                )
-                filtered_df = filtered_df[search_mask]
-
-            # Display a list of applications with expandable details
-            for index, job in filtered_df.iterrows():
-                with st.expander(f"{job['company']} - {job['position']} ({job['status']})"):
-                    update_job_details(job)
+                # Search company and position in one pass; the unit separator keeps a
+                # match from spanning the two fields
+                haystack = jobs_df['company'].fillna('') + '\x1f' + jobs_df['position'].fillna('')
+                mask &= haystack.str.contains(search_term, case=False, regex=False, na=False)
+
+            # Display a list of applications with expandable details; each expander
+            # reruns on toggle, so detail widgets are only built for the open ones
+            for job in jobs_df[mask].to_dict('records'):
+                with st.expander(f"{job['company']} - {job['position']} ({job['status']})",
+                                 key=f"job_expander_{job['id']}", on_change="rerun") as job_expander:
+                    if job_expander.open:
+                        update_job_details(job)
         else:
             st.info("No job applications added yet. Use the 'Add New Application' tab to get started!")
 
@@ -114,24 +100,30 @@ def update_job_details(job):
     Display and allow updating of a job application's details.
 
     Args:
-        job: Series containing job application data
+        job: dict of job application data, one row of get_all_jobs()
     """
     job_id = job['id']
+    status_options = get_status_options()
+    status_index = get_status_index()
     col1, col2 = st.columns(2)
 
     with col1:
-        # Apply custom styling to make text purple instead of white
-        st.markdown(f"<div style='color: #67597A; font-weight: bold;'>Company:</div> <div style='color: #67597A;'>{job['company']}</div>", unsafe_allow_html=True)
-        st.markdown(f"<div style='color: #67597A; font-weight: bold;'>Position:</div> <div style='color: #67597A;'>{job['position']}</div>", unsafe_allow_html=True)
-        st.markdown(f"<div style='color: #67597A; font-weight: bold;'>Date Applied:</div> <div style='color: #67597A;'>{job['date_applied']}</div>", unsafe_allow_html=True)
-        st.markdown(f"<div style='color: #67597A; font-weight: bold;'>Last Updated:</div> <div style='color: #67597A;'>{job['last_updated']}</div>", unsafe_allow_html=True)
+        # Apply custom styling to make text purple instead of white; the job fields and
+        # the status label go out as one markdown element, with the fields HTML-escaped
+        st.markdown(
+            f"<div style='color: #67597A; font-weight: bold;'>Company:</div> <div style='color: #67597A;'>{html.escape(str(job['company']))}</div>"
+            f"<div style='color: #67597A; font-weight: bold;'>Position:</div> <div style='color: #67597A;'>{html.escape(str(job['position']))}</div>"
+            f"<div style='color: #67597A; font-weight: bold;'>Date Applied:</div> <div style='color: #67597A;'>{html.escape(str(job['date_applied'].date()))}</div>"
+            f"<div style='color: #67597A; font-weight: bold;'>Last Updated:</div> <div style='color: #67597A;'>{html.escape(str(job['last_updated'].date()))}</div>"
+            "<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Update Status:</div>",
+            unsafe_allow_html=True
+        )
 
         # Allow updating status
-        st.markdown("<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Update Status:</div>", unsafe_allow_html=True)
         new_status = st.selectbox(
             " ",  # Using a space for the label to hide it since we're using custom label above
             status_options,
-            index=status_options.index(job['status']) if job['status'] in status_options else 0,
+            index=status_index.get(job['status'], 0),
             key=f"status_{job_id}",
             label_visibility="collapsed"
         )
@@ -146,16 +138,19 @@ def update_job_details(job):
         )
 
     with col2:
-        # Display resume and cover letter download links
-        st.markdown("<div style='color: #67597A; font-weight: bold;'>Resume:</div>", unsafe_allow_html=True)
+        # Display resume and cover letter download links, each with its upload label
         if job['resume_path']:
-            resume_file_name = os.path.basename(job['resume_path'])
-            st.markdown(get_file_download_link(job['resume_path'], resume_file_name), unsafe_allow_html=True)
+            resume_link = get_file_download_link(job['resume_path'], os.path.basename(job['resume_path']))
         else:
-            st.markdown("<div style='color: #67597A;'>No resume uploaded</div>", unsafe_allow_html=True)
+            resume_link = "<div style='color: #67597A;'>No resume uploaded</div>"
+        st.markdown(
+            "<div style='color: #67597A; font-weight: bold;'>Resume:</div>"
+            f"{resume_link}"
+            "<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Upload New Resume:</div>",
+            unsafe_allow_html=True
+        )
 
         # Upload new resume
-        st.markdown("<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Upload New Resume:</div>", unsafe_allow_html=True)
         new_resume = st.file_uploader(
             " ",  # Using a space for the label to hide it
             type=["pdf", "docx", "doc"],
@@ -163,16 +158,19 @@ def update_job_details(job):
             label_visibility="collapsed"
         )
 
-        st.markdown("<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Cover Letter:</div>", unsafe_allow_html=True)
         if job['cover_letter_path']:
-            cover_letter_file_name = os.path.basename(job['cover_letter_path'])
-            st.markdown(get_file_download_link(job['cover_letter_path'], cover_letter_file_name),
-                        unsafe_allow_html=True)
+            cover_letter_link = get_file_download_link(job['cover_letter_path'],
+                                                       os.path.basename(job['cover_letter_path']))
         else:
-            st.markdown("<div style='color: #67597A;'>No cover letter uploaded</div>", unsafe_allow_html=True)
+            cover_letter_link = "<div style='color: #67597A;'>No cover letter uploaded</div>"
+        st.markdown(
+            "<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Cover Letter:</div>"
+            f"{cover_letter_link}"
+            "<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Upload New Cover Letter:</div>",
+            unsafe_allow_html=True
+        )
 
         # Upload new cover letter
-        st.markdown("<div style='color: #67597A; font-weight: bold; margin-top: 15px;'>Upload New Cover Letter:</div>", unsafe_allow_html=True)
         new_cover_letter = st.file_uploader(
             " ",  # Using a space for the label to hide it
             type=["pdf", "docx", "doc"],
@@ -203,13 +201,12 @@ def update_job_details(job):
 
             # Add status history to notes if status has changed
             if new_status != job['status']:
-                status_history = job['notes']
-                if "STATUS HISTORY" not in status_history:
-                    status_history += "\n\nSTATUS HISTORY\n"
-
+                # Build on the edited notes so changes made alongside the status are kept,
+                # and append the history entry in a single concatenation
+                notes = new_notes or ""
+                header = "" if "STATUS HISTORY" in notes else "\n\nSTATUS HISTORY\n"
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-                status_history += f"\n{timestamp}: Changed from '{job['status']}' to '{new_status}'"
-                new_notes = status_history
+                new_notes = f"{notes}{header}\n{timestamp}: Changed from '{job['status']}' to '{new_status}'"
 
             # Update database
             update_job(
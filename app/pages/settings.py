@@ -1,37 +1,16 @@
 # app/pages/settings.py
 
 import streamlit as st
-import pandas as pd
 import json
 import os
-from pathlib import Path
-from io import BytesIO
-from datetime import datetime
+from datetime import date, datetime
 
 from app.utils.database import get_all_jobs, get_study_logs, reset_job_data, reset_study_data, reset_all_data
-from app.utils.file_handler import export_dataframe
+from app.utils.file_handler import EXPORT_FORMATS, dataframes_to_excel, export_dataframe_bytes
+from app.utils.helpers import CONFIG_PATH, get_config as load_config
 from app.components.section_manager import display_section_manager, display_reset_button
 
 
-# Load configuration
-def get_config():
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "app": {
-                "name": "Job Hunt & Study Tracker",
-                "version": "1.0.0"
-            }
-        }
-
-
-config = get_config()
-
-
 def show():
     """Display the settings page."""
     # Custom styling for consistent headers
@@ -40,6 +19,7 @@ def show():
 
     # App information
     st.sidebar.markdown("---")
+    config = load_config()
     app_name = config.get('app', {}).get('name', "Job Hunt & Study Tracker")
     app_version = config.get('app', {}).get('version', "1.0.0")
     st.sidebar.info(f"{app_name} v{app_version}")
@@ -78,11 +58,8 @@ def show_export_options():
             jobs_df = get_all_jobs()
 
             if not jobs_df.empty:
-                filename = "job_applications"
-                st.markdown(
-                    export_dataframe(jobs_df, filename, export_format.lower()),
-                    unsafe_allow_html=True
-                )
+                show_download_button(export_dataframe_bytes(jobs_df, export_format.lower()),
+                                     "job_applications", export_format.lower())
             else:
                 st.info("No job application data to export.")
 
@@ -91,11 +68,8 @@ def show_export_options():
             study_df = get_study_logs()
 
             if not study_df.empty:
-                filename = "study_log"
-                st.markdown(
-                    export_dataframe(study_df, filename, export_format.lower()),
-                    unsafe_allow_html=True
-                )
+                show_download_button(export_dataframe_bytes(study_df, export_format.lower()),
+                                     "study_log", export_format.lower())
             else:
                 st.info("No study log data to export.")
 
@@ -107,37 +81,42 @@ def show_export_options():
         if not jobs_df.empty or not study_df.empty:
             if export_format.lower() == "csv":
                 # For CSV, we'll create separate files
-                download_links = []
-
                 if not jobs_df.empty:
-                    download_links.append(export_dataframe(jobs_df, "job_applications", "csv"))
+                    show_download_button(export_dataframe_bytes(jobs_df, "csv"), "job_applications", "csv")
 
                 if not study_df.empty:
-                    download_links.append(export_dataframe(study_df, "study_log", "csv"))
-
-                for link in download_links:
-                    st.markdown(link, unsafe_allow_html=True)
+                    show_download_button(export_dataframe_bytes(study_df, "csv"), "study_log", "csv")
             else:
                 # For Excel, we'll create a single file with multiple sheets
-                output = BytesIO()
-                with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                    if not jobs_df.empty:
-                        jobs_df.to_excel(writer, sheet_name='Job Applications', index=False)
-
-                    if not study_df.empty:
-                        study_df.to_excel(writer, sheet_name='Study Log', index=False)
+                sheets = {}
+                if not jobs_df.empty:
+                    sheets['Job Applications'] = jobs_df
 
-                output.seek(0)
+                if not study_df.empty:
+                    sheets['Study Log'] = study_df
 
-                # Create download link
-                import base64
-                b64 = base64.b64encode(output.read()).decode()
-                href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="job_hunt_tracker_data.xlsx">Download Excel File</a>'
-                st.markdown(href, unsafe_allow_html=True)
+                show_download_button(dataframes_to_excel(sheets), "job_hunt_tracker_data", "excel")
         else:
             st.info("No data to export.")
 
 
+def show_download_button(data, filename, format_type):
+    """
+    Offer exported bytes as a file download.
+
+    The button does not rerun the app when clicked, so it stays on screen
+    alongside the export button that produced it.
+    """
+    extension, mime_type = EXPORT_FORMATS[format_type]
+    st.download_button(
+        f"Download {filename}.{extension}",
+        data=data,
+        file_name=f"{filename}.{extension}",
+        mime=mime_type,
+        on_click="ignore"
+    )
+
+
 def show_reset_options():
     """Display options for resetting data."""
     st.markdown("<h3 style='color: #67597A;'>Reset Data</h3>", unsafe_allow_html=True)
@@ -174,8 +153,8 @@ def show_app_settings():
     """Display application settings."""
     st.markdown("<h3 style='color: #67597A;'>Application Settings</h3>", unsafe_allow_html=True)
 
-    # Load current configuration
-    current_config = get_config()
+    # Load current configuration (cached and shared, so it is copied before saving)
+    current_config = load_config()
 
     # Study settings
     st.markdown("<h4 style='color: #67597A;'>Study Settings</h4>", unsafe_allow_html=True)
@@ -183,9 +162,9 @@ def show_app_settings():
     # Add test date picker
     default_test_date = current_config.get('study_tracking', {}).get('test_date', "2025-07-16")
     try:
-        default_date_obj = datetime.strptime(default_test_date, "%Y-%m-%d").date()
-    except:
-        default_date_obj = datetime(2025, 7, 16).date()
+        default_date_obj = date.fromisoformat(default_test_date)
+    except (TypeError, ValueError):
+        default_date_obj = date(2025, 7, 16)
 
     test_date = st.date_input(
         "Test Date",
@@ -259,24 +238,27 @@ def show_app_settings():
             statuses = [s.strip() for s in status_options.split('\n') if s.strip()]
 
             # Update configuration
-            current_config['study_tracking'] = {
+            new_config = dict(current_config)
+            new_config['study_tracking'] = {
                 'daily_target_minutes': manual_daily_target,
                 'weekly_target_days': weekly_target_days,
                 'total_target_hours': total_target_hours,
                 'test_date': test_date.strftime("%Y-%m-%d")
             }
 
-            current_config['job_tracking'] = {
+            new_config['job_tracking'] = {
                 'weekly_goal': weekly_goal,
                 'statuses': statuses
             }
 
-            # Save configuration
-            config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-            config_path.parent.mkdir(parents=True, exist_ok=True)
+            # Save configuration; write a temporary file and swap it in, so an
+            # interrupted save never leaves a half-written config behind
+            CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_path, 'w') as f:
-                json.dump(current_config, f, indent=4)
+            tmp_path = CONFIG_PATH.with_suffix('.json.tmp')
+            tmp_path.write_text(json.dumps(new_config, indent=4), encoding='utf-8')
+            os.replace(tmp_path, CONFIG_PATH)
+            load_config.cache_clear()
 
             st.success("Settings saved successfully!")
         except Exception as e:
@@ -1,12 +1,9 @@
 # app/pages/study_tracker.py
 
 import streamlit as st
-import pandas as pd
-import json
 from datetime import datetime, timedelta
-from pathlib import Path
 
-from app.utils.helpers import calculate_daily_target, get_test_date
+from app.utils.helpers import get_config, get_daily_target, get_test_date
 from app.utils.database import get_study_logs
 from app.components.forms import study_log_form
 from app.components.charts import plot_study_progress, plot_weekly_study_progress
@@ -19,28 +16,6 @@ from app.components.achievements import (
 )
 
 
-# Load configuration
-def get_config():
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "study_tracking": {
-                "daily_target_minutes": 70,
-                "weekly_target_days": 5,
-                "total_target_hours": 300  # SOA Exam P target hours
-            }
-        }
-
-
-config = get_config()
-daily_target = config.get('study_tracking', {}).get('daily_target_minutes', 70)
-total_target_hours = config.get('study_tracking', {}).get('total_target_hours', 300)
-
-
 def show():
     """Display the study tracker page."""
     # Initialize achievements database
@@ -60,12 +35,8 @@ def show():
     print(f"Today's date: {today}")
     print(f"Days difference: {(test_date - today).days}")
 
-    # Get the dynamic daily target
-    manual_override = config.get('study_tracking', {}).get('daily_target_minutes', 0)
-    if manual_override > 0:
-        daily_target = manual_override
-    else:
-        daily_target = calculate_daily_target(total_target_hours)
+    # Get the daily target (manual override or computed from the test date)
+    daily_target = get_daily_target()
 
     # Custom styling for consistent headers
     st.markdown(
@@ -100,10 +71,6 @@ def show():
     # Get study data from database
     study_df = get_study_logs()
 
-    # Convert date column to datetime if it's not already
-    if not study_df.empty:
-        study_df['date'] = pd.to_datetime(study_df['date'])
-
     with tab1:
         # Show the study log form
         log_added = study_log_form()
@@ -154,7 +121,7 @@ def show():
                 st.metric("Remaining Time", f"{remaining_hours}h {remaining_minutes}m")
 
             # Display progress against daily target
-            fig = plot_study_progress(study_df, daily_target)
+            fig = plot_study_progress(study_df, daily_target, end_date=today)
 
             # Chart container with transparent background and lime border
             st.markdown(
@@ -171,7 +138,7 @@ def show():
                 """,
                 unsafe_allow_html=True
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, width="stretch")
             st.markdown("</div>", unsafe_allow_html=True)
 
             # Study log table
@@ -188,7 +155,7 @@ def show():
                 columns={'date': 'Date', 'time': 'Study Time', 'notes': 'Notes'}
             )
 
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(display_df, width="stretch")
         else:
             st.info("No study data recorded yet. Use the 'Log Study Time' tab to get started!")
 
@@ -201,19 +168,15 @@ def show():
 
             # Chart container with transparent background and lime border
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, width="stretch")
             st.markdown("</div>", unsafe_allow_html=True)
 
             # Weekly summary statistics
             st.markdown("<h4 style='color: #67597A;'>Weekly Summary</h4>", unsafe_allow_html=True)
 
-            # Create a weekly summary dataframe
-            weekly_df = study_df.copy()
-            weekly_df['week'] = weekly_df['date'].dt.isocalendar().week
-            weekly_df['year'] = weekly_df['date'].dt.isocalendar().year
-            weekly_df['year_week'] = weekly_df['year'].astype(str) + '-W' + weekly_df['week'].astype(str)
-
-            weekly_summary = weekly_df.groupby('year_week')['duration'].agg(['sum', 'count']).reset_index()
+            # Create a weekly summary dataframe keyed by ISO week label
+            year_week = study_df['date'].dt.strftime('%G-W%V')
+            weekly_summary = study_df['duration'].groupby(year_week).agg(['sum', 'count']).reset_index()
             weekly_summary.columns = ['Week', 'Total Minutes', 'Study Days']
 
             # Calculate target and percentage
@@ -234,7 +197,7 @@ def show():
             # Sort by week (most recent first)
             display_weekly = display_weekly.sort_values('Week', ascending=False)
 
-            st.dataframe(display_weekly, use_container_width=True)
+            st.dataframe(display_weekly, width="stretch")
 
             # Display study consistency information
             st.markdown("<h4 style='color: #67597A;'>Study Consistency</h4>", unsafe_allow_html=True)
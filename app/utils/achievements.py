@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 import json
 import pandas as pd
+import streamlit as st
 
 from app.utils.database import get_db_connection, get_study_logs
 
@@ -75,6 +76,9 @@ def init_achievements_db():
     )
     ''')
 
+    # Index the type column used by the unlock checks and the section reset
+    c.execute("CREATE INDEX IF NOT EXISTS idx_achievements_type ON achievements(type)")
+
     # Create user_achievements table to track unlocked achievements
     c.execute('''
     CREATE TABLE IF NOT EXISTS user_achievements (
@@ -125,6 +129,7 @@ def init_achievements_db():
     conn.close()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_all_achievements():
     """Get all achievements with their unlock status."""
     conn = get_db_connection()
@@ -174,6 +179,7 @@ def unlock_achievement(achievement_id):
             )
             conn.commit()
             conn.close()
+            clear_achievement_caches()
             return True  # Newly unlocked
 
         conn.close()
@@ -195,6 +201,7 @@ def unlock_achievement(achievement_id):
                     )
                     conn.commit()
                 conn.close()
+                clear_achievement_caches()
                 return True
             except Exception as retry_error:
                 print(f"Retry failed: {retry_error}")
@@ -204,6 +211,7 @@ def unlock_achievement(achievement_id):
             return False
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_study_sections():
     """Get all study sections with completion status."""
     conn = get_db_connection()
@@ -215,6 +223,9 @@ def get_study_sections():
     ''', conn)
 
     conn.close()
+
+    # SQLite stores the flag as 0/1; expose it as a real boolean column
+    sections_df['completed'] = sections_df['completed'].astype(bool)
     return sections_df
 
 
@@ -231,6 +242,7 @@ def mark_section_completed(section_id):
         )
         conn.commit()
         conn.close()
+        clear_achievement_caches()
 
         # Unlock the corresponding achievement in a separate transaction
         achievement_id = f"complete_{section_id}"
@@ -252,6 +264,7 @@ def mark_section_incomplete(section_id):
 
     conn.commit()
     conn.close()
+    clear_achievement_caches()
 
 
 def check_for_achievements():
@@ -296,6 +309,7 @@ def check_for_achievements():
     return newly_unlocked
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_achievement_by_id(achievement_id):
     """Get details for a specific achievement."""
     conn = get_db_connection()
@@ -311,4 +325,11 @@ def get_achievement_by_id(achievement_id):
     if not achievement_df.empty:
         return achievement_df.iloc[0].to_dict()
 
-    return None
\ No newline at end of file
+    return None
+
+
+def clear_achievement_caches():
+    """Invalidate cached achievement and section queries after a write."""
+    get_all_achievements.clear()
+    get_study_sections.clear()
+    get_achievement_by_id.clear()
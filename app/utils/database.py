@@ -1,27 +1,13 @@
 import sqlite3
 import os
+import queue
 import pandas as pd
-import json
+import streamlit as st
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
-
-# Load configuration
-def get_config():
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "database": {
-                "path": "data/database/job_hunt_tracker.db"
-            },
-            "uploads": {
-                "path": "data/uploads"
-            }
-        }
+from app.utils.helpers import get_config
 
 
 config = get_config()
@@ -36,18 +22,96 @@ DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 UPLOADS_PATH.mkdir(parents=True, exist_ok=True)
 
 
-def get_db_connection():
-    """Create a database connection to the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
+# Number of connections kept open in the shared pool
+POOL_SIZE = 4
+
+# Seconds to wait for a pooled connection before giving up
+POOL_TIMEOUT = 30
+
+# Per-connection settings; with WAL, synchronous=NORMAL only syncs at checkpoints
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=134217728",
+)
+
+
+def _configure_connection(conn):
+    """Apply row access by column name and the per-connection PRAGMAs."""
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+def get_db_connection():
+    """Create a database connection to the SQLite database."""
+    return _configure_connection(sqlite3.connect(DB_PATH))
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool():
+    """Open a pool of SQLite connections shared across reruns and sessions."""
+    pool = queue.Queue(maxsize=POOL_SIZE)
+    for _ in range(POOL_SIZE):
+        pool.put(_configure_connection(sqlite3.connect(DB_PATH, check_same_thread=False)))
+    return pool
+
+
+@contextmanager
+def borrow():
+    """
+    Borrow a pooled connection for the duration of a with-block.
+
+    The connection keeps the default transaction handling, so callers still
+    commit or roll back; anything left uncommitted is rolled back on return.
+    Raises RuntimeError if no connection frees up within POOL_TIMEOUT seconds.
+    """
+    pool = get_pool()
+    try:
+        conn = pool.get(timeout=POOL_TIMEOUT)
+    except queue.Empty:
+        raise RuntimeError(
+            f"No database connection became free within {POOL_TIMEOUT} seconds "
+            f"(all {POOL_SIZE} pooled connections are in use)"
+        ) from None
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put(conn)
+
+
+@contextmanager
+def transaction():
+    """
+    Run a with-block as a single write transaction on a pooled connection.
+
+    Yields a cursor after taking the write lock with BEGIN IMMEDIATE. The
+    transaction is committed if the block exits normally and rolled back
+    if it raises.
+    """
+    with borrow() as conn:
+        c = conn.cursor()
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            yield c
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
 def init_db():
     """Initialize the database with required tables."""
     conn = get_db_connection()
     c = conn.cursor()
 
+    # Write-ahead logging is stored in the database file, so set it once here
+    c.execute("PRAGMA journal_mode=WAL")
+
     # Create jobs table if it doesn't exist
     c.execute('''
     CREATE TABLE IF NOT EXISTS jobs (
@@ -73,6 +137,10 @@ def init_db():
     )
     ''')
 
+    # Index the date columns used for ordering the full reads and the per-day study lookup
+    c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_date_applied ON jobs(date_applied)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_study_log_date ON study_log(date)")
+
     conn.commit()
     conn.close()
 
@@ -89,6 +157,7 @@ def add_job(company, position, date_applied, status, notes, resume_path=None, co
     conn.commit()
     job_id = c.lastrowid
     conn.close()
+    clear_data_caches()
     return job_id
 
 
@@ -114,16 +183,22 @@ def update_job(job_id, status=None, notes=None, resume_path=None, cover_letter_p
         )
         conn.commit()
         conn.close()
+        clear_data_caches()
         return True
 
     conn.close()
     return False
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_all_jobs():
-    """Get all job applications."""
+    """Get all job applications, with date columns parsed to datetime64."""
     conn = get_db_connection()
-    jobs_df = pd.read_sql("SELECT * FROM jobs ORDER BY date_applied DESC", conn)
+    jobs_df = pd.read_sql(
+        "SELECT * FROM jobs ORDER BY date_applied DESC",
+        conn,
+        parse_dates=['date_applied', 'last_updated']
+    )
     conn.close()
     return jobs_df
 
@@ -145,6 +220,7 @@ def delete_job(job_id):
     c.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
     conn.commit()
     conn.close()
+    clear_data_caches()
 
 
 # Study-related database operations
@@ -166,6 +242,7 @@ def log_study_time(date, duration, notes=""):
         )
         conn.commit()
         conn.close()
+        clear_data_caches()
         return existing['id']
     else:
         # Create new entry
@@ -176,17 +253,25 @@ def log_study_time(date, duration, notes=""):
         conn.commit()
         log_id = c.lastrowid
         conn.close()
+        clear_data_caches()
         return log_id
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_study_logs():
-    """Get all study logs."""
+    """Get all study logs, with the date column parsed to datetime64."""
     conn = get_db_connection()
-    study_df = pd.read_sql("SELECT * FROM study_log ORDER BY date DESC", conn)
+    study_df = pd.read_sql("SELECT * FROM study_log ORDER BY date DESC", conn, parse_dates=['date'])
     conn.close()
     return study_df
 
 
+def clear_data_caches():
+    """Invalidate the cached job and study log reads after a write."""
+    get_all_jobs.clear()
+    get_study_logs.clear()
+
+
 def reset_job_data():
     """Reset all job application data."""
     conn = get_db_connection()
@@ -194,6 +279,7 @@ def reset_job_data():
     c.execute("DELETE FROM jobs")
     conn.commit()
     conn.close()
+    clear_data_caches()
 
 
 def reset_study_data():
@@ -203,6 +289,7 @@ def reset_study_data():
     c.execute("DELETE FROM study_log")
     conn.commit()
     conn.close()
+    clear_data_caches()
 
 
 def reset_all_data():
@@ -5,8 +5,16 @@ from pathlib import Path
 import shutil
 from io import BytesIO
 
+import pandas as pd
+
 from app.utils.database import UPLOADS_PATH
 
+# File extension and MIME type for each export format
+EXPORT_FORMATS = {
+    "csv": ("csv", "text/csv"),
+    "excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
 
 def save_uploaded_file(uploaded_file, directory_name=None):
     """
@@ -159,6 +167,39 @@ def get_file_download_link(file_path, file_name=None):
     return "No file available"
 
 
+def dataframes_to_excel(sheets):
+    """
+    Write one or more dataframes to an in-memory Excel workbook.
+
+    Args:
+        sheets: Mapping of sheet name to DataFrame
+
+    Returns:
+        bytes: Contents of the .xlsx file
+    """
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': {'in_memory': True}}) as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+
+def export_dataframe_bytes(df, format_type="csv"):
+    """
+    Serialize a dataframe for download as CSV or Excel.
+
+    Args:
+        df: Pandas DataFrame to export
+        format_type: Either "csv" or "excel"
+
+    Returns:
+        bytes: File contents, ready for st.download_button
+    """
+    if format_type.lower() == "csv":
+        return df.to_csv(index=False).encode()
+    return dataframes_to_excel({'Data': df})
+
+
 def export_dataframe(df, filename, format_type="csv"):
     """
     Export a dataframe to CSV or Excel.
@@ -171,22 +212,14 @@ def export_dataframe(df, filename, format_type="csv"):
     Returns:
         str: HTML link for downloading the file
     """
-    if format_type.lower() == "csv":
-        csv = df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
-        href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv">Download CSV File</a>'
-        return href
-
-    elif format_type.lower() == "excel":
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, sheet_name='Data', index=False)
-        output.seek(0)
-        b64 = base64.b64encode(output.read()).decode()
-        href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}.xlsx">Download Excel File</a>'
-        return href
-
-    return "Invalid format type"
+    format_type = format_type.lower()
+    if format_type not in EXPORT_FORMATS:
+        return "Invalid format type"
+
+    extension, mime_type = EXPORT_FORMATS[format_type]
+    b64 = base64.b64encode(export_dataframe_bytes(df, format_type)).decode()
+    label = "CSV" if format_type == "csv" else "Excel"
+    return f'<a href="data:{mime_type};base64,{b64}" download="{filename}.{extension}">Download {label} File</a>'
 
 
 def delete_file(file_path):
@@ -7,62 +7,71 @@ import datetime
 import pandas as pd
 import numpy as np
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
+# Location of the JSON configuration file, relative to the project root
+CONFIG_PATH = Path(__file__).resolve().parents[2] / 'config' / 'app_config.json'
+
+# Default configuration, used when config/app_config.json does not exist
+DEFAULT_CONFIG = {
+    "app": {
+        "name": "Job Hunt & Study Tracker",
+        "version": "1.0.0"
+    },
+    "database": {
+        "path": "data/database/job_hunt_tracker.db"
+    },
+    "uploads": {
+        "path": "data/uploads",
+        "allowed_extensions": ["pdf", "docx", "doc", "txt"]
+    },
+    "job_tracking": {
+        "weekly_goal": 5,
+        "statuses": [
+            "Applied",
+            "No Response",
+            "Rejected",
+            "Screening Call",
+            "Interview",
+            "Second Interview",
+            "Final Interview",
+            "Offer",
+            "Accepted",
+            "Declined"
+        ]
+    },
+    "study_tracking": {
+        "daily_target_minutes": 70,
+        "weekly_target_days": 5,
+        "total_target_hours": 300,
+        "test_date": "2025-07-16"
+    },
+    "ui": {
+        "theme_color": "#4C78A8",
+        "secondary_color": "#59A14F",
+        "warning_color": "#E15759",
+        "affirmations_enabled": True
+    }
+}
+
+
+@lru_cache(maxsize=1)
 def get_config():
     """
     Load application configuration from the config file.
 
+    The file is read once per process; call ``get_config.cache_clear()`` after
+    writing it. Callers must treat the returned dict as read-only.
+
     Returns:
         dict: Application configuration
     """
-    config_path = Path(__file__).parents[2] / 'config' / 'app_config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
+    if CONFIG_PATH.exists():
+        with open(CONFIG_PATH, 'rb') as f:
             return json.load(f)
-    else:
-        # Default configuration
-        return {
-            "app": {
-                "name": "Job Hunt & Study Tracker",
-                "version": "1.0.0"
-            },
-            "database": {
-                "path": "data/database/job_hunt_tracker.db"
-            },
-            "uploads": {
-                "path": "data/uploads",
-                "allowed_extensions": ["pdf", "docx", "doc", "txt"]
-            },
-            "job_tracking": {
-                "weekly_goal": 5,
-                "statuses": [
-                    "Applied",
-                    "No Response",
-                    "Rejected",
-                    "Screening Call",
-                    "Interview",
-                    "Second Interview",
-                    "Final Interview",
-                    "Offer",
-                    "Accepted",
-                    "Declined"
-                ]
-            },
-            "study_tracking": {
-                "daily_target_minutes": 70,
-                "weekly_target_days": 5,
-                "total_target_hours": 300,
-                "test_date": "2025-07-16"
-            },
-            "ui": {
-                "theme_color": "#4C78A8",
-                "secondary_color": "#59A14F",
-                "warning_color": "#E15759",
-                "affirmations_enabled": True
-            }
-        }
+    return DEFAULT_CONFIG
 
 
 def get_date_range(start_date, end_date):
@@ -102,6 +111,21 @@ def get_week_dates(year, week):
     return start_date, end_date
 
 
+def daily_counts_and_cumsum(day_offsets, n_days):
+    """
+    Count events per day and their running total.
+
+    Args:
+        day_offsets: Integer array of day offsets from the first day (0-based)
+        n_days: Number of days in the output range
+
+    Returns:
+        tuple: (daily_counts, cumulative_counts) as NumPy int arrays of length n_days
+    """
+    daily_counts = np.bincount(day_offsets, minlength=n_days)
+    return daily_counts, np.cumsum(daily_counts)
+
+
 def calculate_application_stats(jobs_df):
     """
     Calculate statistics from job application data.
@@ -331,4 +355,21 @@ def calculate_daily_target(total_target_hours=300, test_date=None):
     # Calculate daily target (minimum 10 minutes)
     daily_target = max(10, remaining_minutes // days_remaining)
 
-    return int(daily_target)
\ No newline at end of file
+    return int(daily_target)
+
+
+def get_daily_target():
+    """
+    Get the daily study target in minutes from the current configuration.
+
+    Returns:
+        int: The manual target from settings if one is set, otherwise the
+            dynamically calculated target
+    """
+    config = get_config()
+    manual_override = config.get('study_tracking', {}).get('daily_target_minutes', 0)
+    if manual_override > 0:
+        return manual_override
+
+    total_target_hours = config.get('study_tracking', {}).get('total_target_hours', 300)
+    return calculate_daily_target(total_target_hours)
@@ -6,10 +6,11 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "streamlit>=1.23.0",
+        "streamlit>=1.65.0",
         "pandas>=1.5.0",
         "numpy>=1.23.0",
         "plotly>=5.13.0",
+        "orjson>=3.8.0",
         "SQLAlchemy>=2.0.0",
         "xlsxwriter>=3.0.0",
     ],